@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Prefix autocomplete over the collated dictionary key index
+Answers search-as-you-type queries with the top-k completions, easiest level first
+"""
+
+import heapq
+import json
+import random
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from greek_text import LEVEL_RANK, LEVELS, headword_forms, query_key, to_greeklish
+
+TOP_K = 10
+
+# Sorts after every character that can appear in a key, closing a prefix range
+PREFIX_END = '\U0010ffff'
+
+
+def entry_order(entries: List[Dict]) -> List[int]:
+    """
+    Rank every entry for display: level first (A1 before B2),
+    then Greek alphabetical order, then entry id as a final tie-break
+    """
+    def sort_key(entry_id):
+        entry = entries[entry_id]
+        forms = headword_forms(entry.get('greek_normalized') or entry['greek'])
+        return (
+            LEVEL_RANK.get(entry.get('level'), len(LEVELS)),
+            forms[0] if forms else '',
+            entry_id,
+        )
+
+    ordered = sorted(range(len(entries)), key=sort_key)
+    rank = [0] * len(entries)
+    for position, entry_id in enumerate(ordered):
+        rank[entry_id] = position
+    return rank
+
+
+def build_autocomplete_index(entries: List[Dict], top_k: int = TOP_K) -> Dict:
+    """
+    Build the sorted key array and the per-prefix top-k buckets
+
+    Every headword form is indexed twice: folded Greek and Greeklish.
+    A bucket is only stored for prefixes matching more than top_k keys;
+    narrower prefixes are answered from the (at most top_k long) key range itself.
+    """
+    pairs = set()
+    for entry_id, entry in enumerate(entries):
+        for form in headword_forms(entry.get('greek_normalized') or entry['greek']):
+            pairs.add((form, entry_id))
+            pairs.add((to_greeklish(form), entry_id))
+
+    pairs = sorted(pairs)
+    keys = [key for key, _ in pairs]
+    ids = [entry_id for _, entry_id in pairs]
+    rank = entry_order(entries)
+
+    prefixes = {key[:length] for key in set(keys) for length in range(1, len(key) + 1)}
+
+    buckets = {}
+    for prefix in sorted(prefixes):
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + PREFIX_END, lo)
+        if hi - lo > top_k:
+            buckets[prefix] = heapq.nsmallest(top_k, set(ids[lo:hi]), key=rank.__getitem__)
+
+    return {
+        'top_k': top_k,
+        'keys': keys,
+        'ids': ids,
+        'rank': rank,
+        'buckets': buckets,
+    }
+
+
+class Autocomplete:
+    """Query side of the autocomplete index built by build_autocomplete_index"""
+
+    def __init__(self, index: Dict):
+        self.top_k = index['top_k']
+        self.keys = index['keys']
+        self.ids = index['ids']
+        self.rank = index['rank']
+        self.buckets = index['buckets']
+
+    @classmethod
+    def load(cls, path: str) -> 'Autocomplete':
+        """Load the autocomplete section of a dictionary index file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)['autocomplete'])
+
+    def complete(self, prefix: str, k: Optional[int] = None) -> List[int]:
+        """
+        Return up to k entry ids whose headword starts with prefix
+
+        Greek (with or without accents) and Greeklish input are both accepted.
+        k is capped at the top_k the index was built with.
+        """
+        k = self.top_k if k is None else min(k, self.top_k)
+        key = query_key(prefix)
+        if not key or k <= 0:
+            return []
+
+        bucket = self.buckets.get(key)
+        if bucket is not None:
+            return bucket[:k]
+
+        # No bucket means the range holds at most top_k keys
+        lo = bisect_left(self.keys, key)
+        hi = bisect_left(self.keys, key + PREFIX_END, lo)
+        return sorted(set(self.ids[lo:hi]), key=self.rank.__getitem__)[:k]
+
+
+def linear_complete(entry_keys: List[List[str]], prefix: str, k: int = TOP_K) -> List[int]:
+    """Reference implementation: scan every entry's keys (what search-as-you-type did before)"""
+    key = query_key(prefix)
+    matches = [
+        entry_id for entry_id, keys in enumerate(entry_keys)
+        if any(candidate.startswith(key) for candidate in keys)
+    ]
+    return matches[:k]
+
+
+if __name__ == "__main__":
+    from build_dictionary_index import DICTIONARY_FILE, INDEX_FILE
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    autocomplete = Autocomplete.load(INDEX_FILE)
+
+    entry_keys = []
+    for entry in entries:
+        forms = headword_forms(entry['greek_normalized'])
+        entry_keys.append(forms + [to_greeklish(form) for form in forms])
+
+    random.seed(0)
+    queries = []
+    for entry in random.sample(entries, 200):
+        form = headword_forms(entry['greek_normalized'])[0]
+        queries.extend(form[:length] for length in range(1, min(len(form), 6) + 1))
+
+    print("\n" + "="*80)
+    print("AUTOCOMPLETE BENCHMARK")
+    print("="*80)
+
+    start = time.perf_counter()
+    for query in queries:
+        autocomplete.complete(query)
+    indexed = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    for query in queries[:200]:
+        linear_complete(entry_keys, query)
+    linear = (time.perf_counter() - start) / 200
+
+    print(f"\nQueries: {len(queries)} prefixes over {len(entries)} entries")
+    print(f"   Indexed: {indexed * 1e6:8.1f} µs/query")
+    print(f"   Linear:  {linear * 1e6:8.1f} µs/query ({linear / indexed:.0f}x slower)")
+
+    print("\nSample: 'σπ' / 'sp'")
+    for query in ('σπ', 'sp'):
+        words = [entries[i]['greek'] + ' (' + entries[i]['level'] + ')' for i in autocomplete.complete(query, 5)]
+        print(f"   {query}: {', '.join(words)}")
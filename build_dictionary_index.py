@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Build search indexes and distractor tables for the merged dictionary
+Reads src/dictionary.json and writes src/dictionary-index.json and src/distractors.json
+"""
+
+import json
+import os
+import time
+from typing import Dict, List
+
+from autocomplete import TOP_K, build_autocomplete_index
+from distractors import build_distractors
+from reverse_index import build_reverse_index
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DICTIONARY_FILE = os.path.join(ROOT_DIR, 'src', 'dictionary.json')
+INDEX_FILE = os.path.join(ROOT_DIR, 'src', 'dictionary-index.json')
+# Kept separate from the index so the app bundle only carries what flashcards need
+DISTRACTORS_FILE = os.path.join(ROOT_DIR, 'src', 'distractors.json')
+
+
+def build_index(entries: List[Dict]) -> Dict:
+    """Build every index section; entry ids are positions in the dictionary array"""
+    return {
+        'entries': len(entries),
+        'autocomplete': build_autocomplete_index(entries, TOP_K),
+        'reverse': build_reverse_index(entries),
+    }
+
+
+def write_index(index, output_file: str):
+    """Write an index compactly - it is loaded by code, not read by people"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("BUILDING DICTIONARY INDEX")
+    print("="*80)
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    start = time.perf_counter()
+    index = build_index(entries)
+    distractors = build_distractors(entries)
+    elapsed = time.perf_counter() - start
+
+    write_index(index, INDEX_FILE)
+    write_index(distractors, DISTRACTORS_FILE)
+
+    autocomplete = index['autocomplete']
+    print(f"\nEntries: {len(entries)}")
+    print(f"Autocomplete: {len(autocomplete['keys'])} keys, "
+          f"{len(autocomplete['buckets'])} prefix buckets (top {autocomplete['top_k']})")
+    print(f"Reverse index: {len(index['reverse']['postings'])} English tokens")
+    print(f"Distractors: {sum(len(ranked) for ranked in distractors)} for {len(distractors)} entries")
+    print(f"\n⏱  Built in {elapsed:.2f}s")
+    for path in (INDEX_FILE, DISTRACTORS_FILE):
+        print(f"💾 Saved to: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Vocabulary coverage analyzer: annotate Greek text with CEFR levels
+Matches single and multi-word headwords ("(μου) αρέσει") on accent-folded tokens
+
+Usage:
+    python3 coverage_analyzer.py annotate passage.txt
+    python3 coverage_analyzer.py report corpus/*.txt --workers 8
+    python3 coverage_analyzer.py benchmark --mb 20
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from build_dictionary_index import DICTIONARY_FILE
+from greek_text import LEVEL_RANK, LEVELS, ending_forms, fold, headword_forms
+
+# Marks the end of a headword in the token trie; cannot collide with a token
+MATCH = ''
+
+# Lines per work unit sent to a pool worker
+CHUNK_LINES = 2000
+
+# Chunks queued per pool worker; bounds how far ahead of the workers the input is read
+CHUNKS_IN_FLIGHT = 2
+
+TOKEN_RE = re.compile(r'[^\W\d_]+')
+
+# "ό,τι" (whatever) is one word with a comma in it; kept whole so it is not read as "ό" + "τι"
+# and does not share the key "οτι" with "ότι" (that). The slower pattern only runs on text containing ",τι".
+COMMA_WORDS = {'ο,τι'}
+COMMA_TOKEN_RE = re.compile(r'(?<![^\W\d_])[οό],τι(?![^\W\d_])|[^\W\d_]+', re.IGNORECASE)
+
+
+def tokenize(folded: str) -> List[str]:
+    """Word tokens of folded text"""
+    return (COMMA_TOKEN_RE if ',τι' in folded else TOKEN_RE).findall(folded)
+
+# Worker-global automaton, built once per process by init_worker
+_automaton: Optional['CoverageAutomaton'] = None
+
+
+class CoverageAutomaton:
+    """
+    Token-level trie over folded headword forms with greedy longest match
+
+    Each headword form maps to the entry with the lowest level, so a word
+    listed at A1 and again at B2 counts as A1.
+    """
+
+    def __init__(self, entries: List[Dict]):
+        self.entries = entries
+        self.trie: Dict = {}
+        self.max_depth = 1
+
+        # Headwords first; endings spelled out from "μεγάλος, -η, -ο" only fill
+        # forms that are not some entry's headword
+        for entry_id, entry in enumerate(entries):
+            greek = entry.get('greek_normalized') or entry['greek']
+            folded = fold(greek).strip()
+            forms = [folded] if folded in COMMA_WORDS else headword_forms(greek)
+            for form in forms:
+                self._insert(form, entry_id)
+        for entry_id, entry in enumerate(entries):
+            for form in ending_forms(entry.get('greek_normalized') or entry['greek']):
+                self._insert(form, entry_id, replace=False)
+
+    def _insert(self, form: str, entry_id: int, replace: bool = True):
+        """Map a form to the entry, keeping the easiest level when forms collide"""
+        tokens = tokenize(form)
+        if not tokens:
+            return
+        node = self.trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        best = node.get(MATCH)
+        rank = LEVEL_RANK.get(self.entries[entry_id].get('level'), len(LEVELS))
+        if best is None or (replace and (rank, entry_id) <
+                            (LEVEL_RANK.get(self.entries[best].get('level'), len(LEVELS)), best)):
+            node[MATCH] = entry_id
+        self.max_depth = max(self.max_depth, len(tokens))
+
+    def match(self, tokens: List[str]) -> Iterator[Tuple[int, int, Optional[int]]]:
+        """
+        Yield (start, end, entry_id) spans covering the folded tokens
+
+        Unknown tokens come out as single-token spans with entry_id None.
+        """
+        position = 0
+        while position < len(tokens):
+            node = self.trie
+            best_end, best_id = position + 1, None
+            for index in range(position, min(len(tokens), position + self.max_depth)):
+                node = node.get(tokens[index])
+                if node is None:
+                    break
+                if MATCH in node:
+                    best_end, best_id = index + 1, node[MATCH]
+            yield position, best_end, best_id
+            position = best_end
+
+    def annotate(self, text: str) -> List[Tuple[str, Optional[str], Optional[int]]]:
+        """Return (original text span, level or None, entry_id or None) for every match"""
+        found = list(COMMA_TOKEN_RE.finditer(text))
+        tokens = [fold(m.group()) for m in found]
+        result = []
+        for start, end, entry_id in self.match(tokens):
+            span = text[found[start].start():found[end - 1].end()]
+            level = self.entries[entry_id].get('level') if entry_id is not None else None
+            result.append((span, level, entry_id))
+        return result
+
+    def count(self, text: str) -> Dict:
+        """Token counts per level plus unknown words for a block of text"""
+        tokens = tokenize(fold(text))
+        levels = Counter()
+        unknown = Counter()
+        for start, end, entry_id in self.match(tokens):
+            if entry_id is None:
+                unknown[tokens[start]] += 1
+            else:
+                levels[self.entries[entry_id].get('level')] += end - start
+        return {'tokens': len(tokens), 'levels': levels, 'unknown': unknown}
+
+
+def merge_counts(total: Dict, part: Dict):
+    total['tokens'] += part['tokens']
+    total['levels'].update(part['levels'])
+    total['unknown'].update(part['unknown'])
+
+
+def init_worker(entries: List[Dict]):
+    global _automaton
+    _automaton = CoverageAutomaton(entries)
+
+
+def count_chunk(text: str) -> Dict:
+    return _automaton.count(text)
+
+
+def read_chunks(paths: List[str], chunk_lines: int = CHUNK_LINES) -> Iterator[str]:
+    """Stream files as blocks of lines so memory stays flat for any corpus size"""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = []
+            for line in f:
+                lines.append(line)
+                if len(lines) >= chunk_lines:
+                    yield ''.join(lines)
+                    lines = []
+            if lines:
+                yield ''.join(lines)
+
+
+def analyze_stream(entries: List[Dict], chunks: Iterator[str], workers: int = 0) -> Dict:
+    """
+    Count coverage over a stream of text chunks
+
+    workers=0 runs in-process; otherwise chunks are spread over a process pool
+    where each worker compiles the automaton once.
+    """
+    total = {'tokens': 0, 'levels': Counter(), 'unknown': Counter()}
+    if workers == 0:
+        automaton = CoverageAutomaton(entries)
+        for chunk in chunks:
+            merge_counts(total, automaton.count(chunk))
+        return total
+
+    # Executor.map would pull the whole stream into memory up front, so submit
+    # through a bounded window and merge results as they finish
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(entries,)) as pool:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= CHUNKS_IN_FLIGHT * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge_counts(total, future.result())
+            pending.add(pool.submit(count_chunk, chunk))
+        for future in pending:
+            merge_counts(total, future.result())
+    return total
+
+
+def print_report(counts: Dict, top_unknown: int = 20):
+    tokens = counts['tokens'] or 1
+    print(f"\nTokens: {counts['tokens']}")
+    print(f"\n{'Level':<10} {'Tokens':>10} {'Share':>8} {'Cumulative':>12}")
+    print("-" * 80)
+    cumulative = 0
+    for level in LEVELS:
+        count = counts['levels'][level]
+        cumulative += count
+        print(f"{level:<10} {count:>10} {count / tokens * 100:>7.1f}% {cumulative / tokens * 100:>11.1f}%")
+    unknown = sum(counts['unknown'].values())
+    print(f"{'unknown':<10} {unknown:>10} {unknown / tokens * 100:>7.1f}%")
+
+    if counts['unknown']:
+        print(f"\n❓ Most frequent unknown words (first {top_unknown}):")
+        for word, count in counts['unknown'].most_common(top_unknown):
+            print(f"   {word}: {count}")
+
+
+def synthetic_corpus(entries: List[Dict], size_bytes: int, seed: int = 0) -> List[str]:
+    """Random lines of dictionary headwords mixed with unknown words, about size_bytes in total"""
+    rng = random.Random(seed)
+    words = [re.sub(r',.*', '', entry['greek']) for entry in entries]
+    filler = ['και', 'το', 'να', 'θα', 'στο', 'ένας', 'πολύ', 'κάτι', 'Αθήνα', 'χθεσινός']
+    lines, size = [], 0
+    while size < size_bytes:
+        line = ' '.join(rng.choice(words) if rng.random() < 0.7 else rng.choice(filler)
+                        for _ in range(12)) + '.\n'
+        lines.append(line)
+        size += len(line.encode('utf-8'))
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    annotate_parser = subparsers.add_parser('annotate', help='print every token with its level')
+    annotate_parser.add_argument('file')
+    report_parser = subparsers.add_parser('report', help='coverage per level for one or more files')
+    report_parser.add_argument('files', nargs='+')
+    report_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    benchmark_parser = subparsers.add_parser('benchmark', help='tokens per second on a synthetic corpus')
+    benchmark_parser.add_argument('--mb', type=float, default=10)
+    benchmark_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    if args.command == 'annotate':
+        with open(args.file, 'r', encoding='utf-8') as f:
+            text = f.read()
+        automaton = CoverageAutomaton(entries)
+        for span, level, entry_id in automaton.annotate(text):
+            gloss = entries[entry_id]['english'] if entry_id is not None else ''
+            print(f"{span:<30} {level or '—':<4} {gloss}")
+        print_report(automaton.count(text))
+
+    elif args.command == 'report':
+        start = time.perf_counter()
+        counts = analyze_stream(entries, read_chunks(args.files), args.workers)
+        elapsed = time.perf_counter() - start
+        print_report(counts)
+        print(f"\n⏱  {elapsed:.2f}s ({counts['tokens'] / elapsed:,.0f} tokens/s)")
+
+    else:
+        lines = synthetic_corpus(entries, int(args.mb * 1024 * 1024))
+        chunks = [''.join(lines[i:i + CHUNK_LINES]) for i in range(0, len(lines), CHUNK_LINES)]
+
+        print("\n" + "="*80)
+        print(f"COVERAGE ANALYZER BENCHMARK: {args.mb:g} MB synthetic corpus")
+        print("="*80)
+
+        for workers in sorted({0, args.workers}):
+            start = time.perf_counter()
+            counts = analyze_stream(entries, iter(chunks), workers)
+            elapsed = time.perf_counter() - start
+            label = 'in-process' if workers == 0 else f"{workers} workers"
+            print(f"\n{label:<12} {counts['tokens']:>10} tokens in {elapsed:6.2f}s "
+                  f"= {counts['tokens'] / elapsed:>12,.0f} tokens/s")
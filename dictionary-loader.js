@@ -0,0 +1,62 @@
+// Worker thread for server.js: reads, checksums, parses and validates a
+// published dictionary version so none of that runs on the request loop.
+import { parentPort, workerData } from 'worker_threads'
+import fs from 'fs'
+import path from 'path'
+import crypto from 'crypto'
+
+const LEVELS = ['A1', 'A2', 'B1', 'B2']
+
+const readVerifiedFile = async (versionDir, name, manifest) => {
+  const info = manifest.files && manifest.files[name]
+  if (!info) throw new Error(`${name} is not listed in the manifest`)
+  const data = await fs.promises.readFile(path.join(versionDir, name))
+  const checksum = crypto.createHash('sha256').update(data).digest('hex')
+  if (checksum !== info.sha256) throw new Error(`${name} checksum mismatch`)
+  return JSON.parse(data.toString('utf8'))
+}
+
+// Throws if the words or index do not look like a usable dictionary
+const validateDictionary = (words, searchIndex, manifest) => {
+  if (!Array.isArray(words) || words.length === 0) {
+    throw new Error('dictionary is empty or not an array')
+  }
+  const invalid = words.findIndex(w => !w || !w.greek || !w.english || !LEVELS.includes(w.level))
+  if (invalid !== -1) {
+    throw new Error(`entry ${invalid} is missing greek/english or has an unknown level`)
+  }
+  if (manifest.entries !== words.length) {
+    throw new Error(`manifest lists ${manifest.entries} entries, dictionary has ${words.length}`)
+  }
+  if (!searchIndex || searchIndex.entries !== words.length || !searchIndex.autocomplete) {
+    throw new Error('search index does not match the dictionary')
+  }
+  const { keys, ids } = searchIndex.autocomplete
+  if (!Array.isArray(keys) || keys.length !== ids.length || ids.some(id => id < 0 || id >= words.length)) {
+    throw new Error('autocomplete index is malformed')
+  }
+  const { reverse } = searchIndex
+  if (!reverse || !reverse.postings || !Array.isArray(reverse.levels) || reverse.levels.length !== words.length) {
+    throw new Error('reverse index is malformed')
+  }
+}
+
+const loadVersion = async ({ dictionaryDir, version }) => {
+  const versionDir = path.join(dictionaryDir, path.basename(version))
+  const manifest = JSON.parse(await fs.promises.readFile(path.join(versionDir, 'manifest.json'), 'utf8'))
+  if (manifest.version !== version) {
+    throw new Error(`manifest version ${manifest.version} does not match ${version}`)
+  }
+  const words = await readVerifiedFile(versionDir, 'dictionary.json', manifest)
+  const searchIndex = await readVerifiedFile(versionDir, 'dictionary-index.json', manifest)
+  validateDictionary(words, searchIndex, manifest)
+
+  return {
+    words,
+    searchIndex: { entries: searchIndex.entries, autocomplete: searchIndex.autocomplete, reverse: searchIndex.reverse }
+  }
+}
+
+loadVersion(workerData)
+  .then(result => parentPort.postMessage({ ok: true, ...result }))
+  .catch(error => parentPort.postMessage({ ok: false, error: error.message }))
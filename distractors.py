@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Build-time distractor tables for multiple-choice flashcards
+For every entry, a ranked list of plausible wrong answers (entry ids)
+
+A good distractor has the same word class, the same level and an English
+gloss of similar length, and shares no gloss token with the right answer
+(otherwise it might be correct too).
+"""
+
+import json
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from greek_text import ARTICLES, ENDING_DASHES, LEVEL_RANK, LEVELS, fold
+from reverse_index import split_glosses
+
+DISTRACTORS = 6
+
+# Score penalty per CEFR level of distance vs. per unit of log gloss-length difference
+LEVEL_WEIGHT = 2.0
+JITTER = 0.05
+
+# Rows scored per numpy pass; bounds the (rows x pool) matrices in memory
+BLOCK_ROWS = 512
+
+POS_CLASSES = {
+    'adv': 'adverb',
+    'adj': 'adjective', 'adjective': 'adjective',
+    'n': 'noun', 'noun': 'noun', 'countable': 'noun', 'non countable': 'noun',
+}
+
+VERB_ENDINGS = ('ω', 'ομαι', 'αμαι', 'ουμαι', 'ιεμαι')
+
+# Common words that end like a verb but are not one (folded)
+NOT_VERBS = {
+    'εδω': 'adverb', 'κατω': 'adverb', 'πανω': 'adverb', 'επανω': 'adverb', 'πισω': 'adverb',
+    'εξω': 'adverb', 'εσω': 'adverb', 'γυρω': 'adverb', 'ανω': 'adverb', 'μεσω': 'adverb',
+    'παρακατω': 'adverb', 'παραπανω': 'adverb',
+    'οκτω': 'other', 'οχτω': 'other', 'δεκαοκτω': 'other', 'δεκαοχτω': 'other',
+    'εγω': 'other', 'εστω': 'other',
+}
+
+
+def word_class(entry: Dict) -> str:
+    """
+    Coarse part of speech from `pos` and the headword notation:
+    "σπίτι, το" is a noun, "άσπρος, -η, -ο" an adjective, "γράφω" a verb
+    """
+    # "adv.; see also πάνω" -> "adv"
+    pos = POS_CLASSES.get(entry.get('pos', '').lower().split(';')[0].strip(' .'))
+    if pos:
+        return pos
+
+    parts = [part.strip() for part in entry['greek'].split(',')]
+    tail = parts[1:]
+    if any(all(fold(article) in ARTICLES for article in part.split('/')) for part in tail):
+        return 'noun'
+    if any(part[:1] in ENDING_DASHES for part in tail if part) or re.search(r'\w-\w', parts[0]):
+        return 'adjective'
+
+    # "μετράω & -ώ" -> "μετραω", "παραπάνω / πιο πάνω" -> "παραπανω"
+    headword = fold(re.split(r'[&/]', parts[0])[0]).strip()
+    if entry.get('english', '').lower().startswith('to '):
+        return 'verb'
+    if headword in NOT_VERBS:
+        return NOT_VERBS[headword]
+    # Only a single word can be judged by its ending: "θα είμαι πίσω" is a phrase
+    if re.fullmatch(r'\w+', headword) and headword.endswith(VERB_ENDINGS):
+        return 'verb'
+    return 'other'
+
+
+def _score_block(rows: np.ndarray, pool: np.ndarray, levels: np.ndarray, log_lengths: np.ndarray,
+                 tokens: np.ndarray, english: np.ndarray, rng: np.random.Generator, k: int) -> List[List[int]]:
+    """Rank the pool for a block of target rows in one vectorized pass"""
+    score = -LEVEL_WEIGHT * np.abs(levels[rows, None] - levels[None, pool])
+    score -= np.abs(log_lengths[rows, None] - log_lengths[None, pool])
+    score += JITTER * rng.random(score.shape)
+
+    # Shared gloss tokens, identical glosses and the entry itself are never distractors
+    overlap = tokens[rows] @ tokens[pool].T
+    score[overlap > 0] = -np.inf
+    score[english[rows, None] == english[None, pool]] = -np.inf
+    score[rows[:, None] == pool[None, :]] = -np.inf
+
+    k = min(k, len(pool))
+    top = np.argpartition(-score, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(score, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    return [
+        [int(pool[column]) for column, value in zip(row, values) if np.isfinite(value)]
+        for row, values in zip(top, top_scores)
+    ]
+
+
+def build_distractors(entries: List[Dict], k: int = DISTRACTORS, seed: int = 0) -> List[List[int]]:
+    """
+    Return distractor entry ids for every entry (list index = entry id)
+
+    Entries are scored against their own word class; a class too small to
+    fill k slots falls back to the whole dictionary.
+    """
+    n = len(entries)
+    levels = np.array([LEVEL_RANK.get(entry.get('level'), len(LEVELS)) for entry in entries], dtype=np.float32)
+    log_lengths = np.log1p(np.array([len(entry.get('english', '')) for entry in entries], dtype=np.float32))
+
+    english_ids = {}
+    english = np.array([english_ids.setdefault(entry.get('english', '').strip().lower(), len(english_ids))
+                        for entry in entries])
+
+    # Only tokens shared by two or more entries can ever overlap
+    entry_tokens = [{token for sense in split_glosses(entry.get('english', '')) for token in sense}
+                    for entry in entries]
+    token_counts = defaultdict(int)
+    for found in entry_tokens:
+        for token in found:
+            token_counts[token] += 1
+    columns = {token: column for column, token in
+               enumerate(sorted(token for token, count in token_counts.items() if count > 1))}
+    tokens = np.zeros((n, len(columns)), dtype=np.float32)
+    for entry_id, found in enumerate(entry_tokens):
+        for token in found:
+            if token in columns:
+                tokens[entry_id, columns[token]] = 1
+
+    classes = defaultdict(list)
+    for entry_id, entry in enumerate(entries):
+        classes[word_class(entry)].append(entry_id)
+
+    rng = np.random.default_rng(seed)
+    everyone = np.arange(n)
+    table: List[List[int]] = [[] for _ in range(n)]
+    for name in sorted(classes):
+        members = np.array(classes[name])
+        pool = members if len(members) > 2 * k else everyone
+        for start in range(0, len(members), BLOCK_ROWS):
+            rows = members[start:start + BLOCK_ROWS]
+            for entry_id, ranked in zip(rows, _score_block(rows, pool, levels, log_lengths,
+                                                            tokens, english, rng, k)):
+                table[int(entry_id)] = ranked
+
+    return table
+
+
+if __name__ == "__main__":
+    from build_dictionary_index import DICTIONARY_FILE
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    start = time.perf_counter()
+    table = build_distractors(entries)
+    elapsed = time.perf_counter() - start
+
+    counts = defaultdict(int)
+    for entry in entries:
+        counts[word_class(entry)] += 1
+
+    print("\n" + "="*80)
+    print("DISTRACTOR TABLES")
+    print("="*80)
+    print(f"\nEntries: {len(entries)} ({', '.join(f'{name}: {count}' for name, count in sorted(counts.items()))})")
+    print(f"Short tables (< {DISTRACTORS}): {sum(1 for ranked in table if len(ranked) < DISTRACTORS)}")
+    print(f"⏱  Built in {elapsed:.2f}s")
+
+    for entry_id in (0, 100, 2000, 5000):
+        entry = entries[entry_id]
+        options = ', '.join(entries[other]['english'] for other in table[entry_id][:3])
+        print(f"\n   {entry['greek']} = {entry['english']} ({entry['level']}, {word_class(entry)})")
+        print(f"      distractors: {options}")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Shared Greek text helpers for the dictionary build and query tools
+Accent folding, headword key extraction and Greeklish transliteration
+"""
+
+import re
+import unicodedata
+from typing import List
+
+# CEFR levels in ascending order of difficulty
+LEVELS = ['A1', 'A2', 'B1', 'B2']
+LEVEL_RANK = {level: rank for rank, level in enumerate(LEVELS)}
+
+# Articles that follow the headword in notation like "πίνακας, ο" or "πόδι/πόδια, το/τα"
+ARTICLES = {'ο', 'η', 'το', 'οι', 'τα', 'ο/η', 'το/τα', 'οι/τα', 'o'}
+
+# Letter-by-letter Greeklish, with the digraphs people actually type handled first.
+# αυ/ευ sound "af"/"ef" before a voiceless consonant or at the end of a word
+# ("ευχαριστώ" -> "efcharisto") and "av"/"ev" otherwise ("αύριο" -> "avrio").
+GREEKLISH_DIGRAPHS = [
+    (re.compile(r'ου'), 'ou'),
+    (re.compile(r'αυ(?=[θκξπστφχψ]|\b)'), 'af'),
+    (re.compile(r'ευ(?=[θκξπστφχψ]|\b)'), 'ef'),
+    (re.compile(r'αυ'), 'av'),
+    (re.compile(r'ευ'), 'ev'),
+]
+
+GREEKLISH_LETTERS = {
+    'α': 'a', 'β': 'v', 'γ': 'g', 'δ': 'd', 'ε': 'e', 'ζ': 'z', 'η': 'i',
+    'θ': 'th', 'ι': 'i', 'κ': 'k', 'λ': 'l', 'μ': 'm', 'ν': 'n', 'ξ': 'x',
+    'ο': 'o', 'π': 'p', 'ρ': 'r', 'σ': 's', 'τ': 't', 'υ': 'y', 'φ': 'f',
+    'χ': 'ch', 'ψ': 'ps', 'ω': 'o',
+}
+
+
+def fold(text: str) -> str:
+    """
+    Lowercase, strip accents/diaeresis and unify final sigma
+
+    The result sorts in Greek alphabetical order by plain code point,
+    so it doubles as the collation key for sorted indexes.
+    """
+    if not text:
+        return ""
+
+    decomposed = unicodedata.normalize('NFD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.lower().replace('ς', 'σ')
+
+
+def clean_key(text: str) -> str:
+    """Fold text and drop punctuation, keeping letters, digits and single spaces"""
+    text = fold(text)
+    text = re.sub(r'[^\w\s]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+# Hyphen, non-breaking hyphen and en dash all mark endings ("-η", "‑ό")
+ENDING_DASHES = '-\u2011\u2013'
+
+# Masculine and feminine headwords are joined by an em dash: "αθλητής, ο — αθλήτρια, η".
+# Commas and slashes separate variants, except the comma inside "ό,τι".
+SEGMENT_SPLIT = re.compile(r'\s*\u2014\s*')
+PART_SPLIT = re.compile(r'(?<!^\w)(?<!\s\w),|/')
+
+
+def strip_article(key: str) -> str:
+    """Drop a leading article from a cleaned key, so "ο συζυγοσ" becomes "συζυγοσ"""
+    first, _, rest = key.partition(' ')
+    return rest if rest and first in ARTICLES else key
+
+
+def headword_forms(greek: str) -> List[str]:
+    """
+    Extract the searchable headword forms of a dictionary entry
+
+    "πίνακας, ο"                  -> ["πινακασ"]
+    "τρώω, τρώγω"                 -> ["τρωω", "τρωγω"]
+    "(ε)βδομάδα, η"               -> ["βδομαδα", "εβδομαδα"]
+    "επτά (εφτά)"                 -> ["επτα", "εφτα"]
+    "(μου) αρέσει"                -> ["αρεσει", "μου αρεσει"]
+    "άσπρος, -η, ‑ο"              -> ["ασπροσ"]
+    "άντρας, ο (σύζυγος)"         -> ["αντρασ", "συζυγοσ"]
+    "εγωιστής, ο — εγωίστρια, η"  -> ["εγωιστησ", "εγωιστρια"]
+    "ό,τι"                        -> ["οτι"]
+
+    Endings ("-η"), articles ("ο/η"), single letters ("φύλλο/α") and empty
+    parts are skipped, and a leading article is dropped from a form - except
+    in a phrase that opens the entry, like "η σειρά μου".
+    Forms are folded, de-duplicated and returned in first-seen order.
+    """
+    forms = []
+
+    parts = [part.strip() for segment in SEGMENT_SPLIT.split(greek) for part in PART_SPLIT.split(segment)]
+    for index, part in enumerate(parts):
+        if not part or part[0] in ENDING_DASHES or fold(part) in ARTICLES:
+            continue
+
+        # Optional letters/words in parentheses: index with and without them.
+        # A parenthesised word after the headword is an alternative in its own
+        # right instead, so "επτά (εφτά)" gives "εφτα" but not "επτα εφτα".
+        candidates = [re.sub(r'\([^)]*\)', '', part)]
+        trailing = re.findall(r'\s\(([^)]+)\)\s*$', part)
+        if trailing:
+            candidates += [inner for inner in trailing if len(clean_key(inner)) >= 2]
+        else:
+            candidates.append(part.replace('(', '').replace(')', ''))
+
+        for candidate in candidates:
+            # "πρώτ-ος" marks the ending inline; the headword is the joined form
+            key = clean_key(re.sub(f'[{ENDING_DASHES}]', '', candidate))
+            if index > 0:
+                key = strip_article(key)
+            if len(key) < 2 or key in ARTICLES or key in forms:
+                continue
+            forms.append(key)
+
+    return forms
+
+
+# Endings stripped from a folded headword before an ending like "-η" is added
+# ("μεγαλοσ" -> "μεγαλ"); longest first
+HEADWORD_ENDINGS = ('οσ', 'ησ', 'ασ', 'υσ', 'εσ', 'ων', 'οι', 'αω', 'εω', 'ω', 'α', 'η', 'ο')
+
+
+def _join_ending(stem: str, ending: str) -> str:
+    """Append an ending, merging a longer one that repeats the stem's last letters ("αθλητ" + "τρια")"""
+    if len(ending) >= 3:
+        for overlap in range(min(len(stem), len(ending) - 1), 0, -1):
+            if stem.endswith(ending[:overlap]):
+                return stem + ending[overlap:]
+    return stem + ending
+
+
+def ending_forms(greek: str) -> List[str]:
+    """
+    Spell out the endings a headword lists in notation
+
+    "μεγάλος, -η, -ο"            -> ["μεγαλη", "μεγαλο"]
+    "πρώτ-ος, -η, -ο"            -> ["πρωτη", "πρωτο"]
+    "διεθνής, -ής, ‑ές"          -> ["διεθνεσ"]
+    "αθλητής/-τρια, ο/η"         -> ["αθλητρια"]
+    "πληροφορία/-ες, η/οι"       -> ["πληροφοριεσ"]
+    "δικός, -ή, -ό / δικοί, -ές, -ά μου" -> ["δικη", "δικο", "δικεσ", "δικα μου"]
+
+    Each "-ending" part attaches to the nearest single-word headword before it,
+    either at its inline dash or after dropping its own ending. Forms already
+    returned by headword_forms are left out.
+    """
+    if not any(dash in greek for dash in ENDING_DASHES):
+        return []
+
+    known = set(headword_forms(greek))
+    forms = []
+
+    for segment in SEGMENT_SPLIT.split(greek):
+        stem = None
+        for part in PART_SPLIT.split(segment):
+            part = part.strip()
+            if not part:
+                continue
+            if part[0] not in ENDING_DASHES:
+                head = clean_key(re.sub(r'\([^)]*\)', '', part))
+                inline = re.match(rf'^(\w+)[{ENDING_DASHES}]\w+$', fold(part).strip())
+                if inline:
+                    stem = inline.group(1)
+                elif head and ' ' not in head and head.endswith(HEADWORD_ENDINGS):
+                    stem = head[:-len(next(e for e in HEADWORD_ENDINGS if head.endswith(e)))]
+                elif head not in ARTICLES:
+                    stem = None
+                continue
+
+            ending = clean_key(re.sub(f'[{ENDING_DASHES}]', '', part))
+            if stem is None or not ending:
+                continue
+            form = _join_ending(stem, ending)
+            if len(form) >= 2 and form not in known and form not in forms:
+                forms.append(form)
+
+    return forms
+
+
+def to_greeklish(text: str) -> str:
+    """Transliterate folded Greek text to the Greeklish most people type"""
+    text = fold(text)
+    for pattern, latin in GREEKLISH_DIGRAPHS:
+        text = pattern.sub(latin, text)
+    return ''.join(GREEKLISH_LETTERS.get(ch, ch) for ch in text)
+
+
+def query_key(text: str) -> str:
+    """
+    Normalize user input the same way index keys are built
+
+    One trailing space is kept: "κάνω " should narrow to multi-word
+    headwords, not widen back to everything under "κανω".
+    """
+    key = clean_key(text)
+    if key and re.search(r'\s$', text):
+        key += ' '
+    return key
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Async load test for the file-backed progress, lists and daily-practice API
+Starts server.js against a seeded scratch DATA_DIR and replays user sessions
+
+Usage:
+    python3 load_test.py                                  # default sweep
+    python3 load_test.py --users 1,10,50 --seed-users 0,50,200 --duration 15
+    python3 load_test.py --url http://localhost:10000     # existing server, no seeding
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from build_dictionary_index import DICTIONARY_FILE, ROOT_DIR
+from greek_text import LEVELS
+
+# A step is flagged when its p95 grows more than this much over the step before it
+# with fewer users (same seeding) or less seeded data (same users)
+CLIFF_FACTOR = 3.0
+
+SERVER_START_TIMEOUT = 30
+
+
+class HttpClient:
+    """Minimal keep-alive HTTP/1.1 JSON client on asyncio streams (one per virtual user)"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, bytes]:
+        """
+        Send one request and return (status, body)
+
+        A keep-alive connection the server already closed is replaced before sending.
+        A failure after the request went out is only retried for a GET on a reused
+        connection; a POST or DELETE may have been applied, so it counts as an error.
+        """
+        if self.writer is not None and (self.reader.at_eof() or self.writer.is_closing()):
+            await self.close()
+        reused = self.writer is not None
+        if not reused:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            return await self._send(method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            if not (reused and method == 'GET'):
+                raise
+
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            return await self._send(method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            raise
+
+    async def _send(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, bytes]:
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        if body is not None:
+            head += ["Content-Type: application/json", f"Content-Length: {len(payload)}"]
+        self.writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b'\r\n')
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            data = b''.join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, data
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.reader = self.writer = None
+
+
+class Stats:
+    """Latencies and errors per endpoint (route template, not the concrete URL)"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def call(self, client: HttpClient, endpoint: str, method: str, path: str,
+                   body: Optional[Dict] = None) -> Optional[Dict]:
+        start = time.perf_counter()
+        try:
+            status, data = await client.request(method, path, body)
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self.errors[endpoint] += 1
+            self.latencies[endpoint].append(time.perf_counter() - start)
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if status >= 400:
+            self.errors[endpoint] += 1
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of unsorted values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+async def user_session(client: HttpClient, stats: Stats, user_id: str, words: List[Dict],
+                       deadline: float, think_ms: int, rng: random.Random):
+    """
+    One virtual user: set up daily practice and a custom list, then loop
+    through browse -> add to list -> mark learned -> practice until the deadline
+    """
+    user = quote(user_id)
+
+    async def think():
+        await asyncio.sleep(rng.uniform(0, think_ms) / 1000)
+
+    await stats.call(client, 'POST /api/daily-practice/:userId/setup', 'POST',
+                     f"/api/daily-practice/{user}/setup", {'level': rng.choice(LEVELS)})
+    created = await stats.call(client, 'POST /api/lists/:userId', 'POST',
+                               f"/api/lists/{user}", {'name': f"Load test {user_id}"})
+    list_id = quote(created['list']['id']) if created else 'a1'
+
+    while time.monotonic() < deadline:
+        word = rng.choice(words)
+
+        await stats.call(client, 'GET /api/lists/:userId', 'GET', f"/api/lists/{user}")
+        await think()
+        await stats.call(client, 'POST /api/lists/:userId/:listId/words', 'POST',
+                         f"/api/lists/{user}/{list_id}/words", {'word': word})
+        await think()
+        await stats.call(client, 'POST /api/lists/:userId/:listId/learned', 'POST',
+                         f"/api/lists/{user}/{list_id}/learned", {'wordGreek': word['greek']})
+        await stats.call(client, 'POST /api/progress/:userId/memorized', 'POST',
+                         f"/api/progress/{user}/memorized", {'word': word['greek']})
+        await stats.call(client, 'POST /api/progress/:userId/exercises', 'POST',
+                         f"/api/progress/{user}/exercises", {})
+        await think()
+        await stats.call(client, 'GET /api/progress/:userId', 'GET', f"/api/progress/{user}")
+        await stats.call(client, 'GET /api/daily-practice/:userId', 'GET', f"/api/daily-practice/{user}")
+        await think()
+
+
+async def run_step(host: str, port: int, users: int, duration: float, think_ms: int,
+                   words: List[Dict], seed: int) -> Tuple[Stats, float]:
+    """Run `users` concurrent sessions for `duration` seconds"""
+    stats = Stats()
+    clients = [HttpClient(host, port) for _ in range(users)]
+    deadline = time.monotonic() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        user_session(client, stats, f"loadtest-{seed}-{index}", words, deadline, think_ms,
+                     random.Random(seed * 100003 + index))
+        for index, client in enumerate(clients)
+    ))
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*(client.close() for client in clients))
+    return stats, elapsed
+
+
+def seed_data_dir(data_dir: str, seed_users: int, entries: List[Dict]):
+    """
+    Pre-populate data files with `seed_users` users shaped like real ones:
+    the four default level lists (full word copies), some progress and daily practice
+    """
+    rng = random.Random(seed_users)
+    lists, progress, practice = {}, {}, {}
+    by_level = defaultdict(list)
+    for entry in entries:
+        by_level[entry['level']].append(entry)
+
+    for index in range(seed_users):
+        user_id = f"seed-{index}"
+        user_lists = []
+        for level in LEVELS:
+            learned = [w['greek'] for w in rng.sample(by_level[level], min(20, len(by_level[level])))]
+            user_lists.append({
+                'id': level.lower(),
+                'name': f"{level} Words",
+                'words': by_level[level],
+                'learnedWords': learned,
+                'wordLearningPoints': {greek: 4 for greek in learned},
+                'isDefault': True,
+                'isReadOnly': True,
+            })
+        lists[user_id] = user_lists
+        progress[user_id] = {'exercisesToday': 0, 'exercisesDate': '', 'memorizedWords': []}
+        practice[user_id] = {'level': rng.choice(LEVELS), 'words': [], 'topic': None, 'date': ''}
+
+    for name, data in (('word-lists.json', lists), ('progress.json', progress),
+                       ('daily-practice.json', practice)):
+        with open(os.path.join(data_dir, name), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def data_dir_size(data_dir: str) -> int:
+    return sum(os.path.getsize(os.path.join(data_dir, name)) for name in os.listdir(data_dir)
+               if name.endswith('.json'))
+
+
+def start_server(data_dir: str, port: int) -> subprocess.Popen:
+    """Start server.js on `port` with `data_dir` and wait until it answers"""
+    env = dict(os.environ, PORT=str(port), DATA_DIR=data_dir)
+    process = subprocess.Popen(['node', 'server.js'], cwd=ROOT_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    async def wait_ready():
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"server.js exited with code {process.returncode}")
+            client = HttpClient('127.0.0.1', port)
+            try:
+                status, _ = await client.request('GET', '/api/dictionary/version')
+                if status == 200:
+                    return
+            except OSError:
+                pass
+            finally:
+                await client.close()
+            await asyncio.sleep(0.2)
+        raise RuntimeError('server.js did not start in time')
+
+    try:
+        asyncio.run(wait_ready())
+    except BaseException:
+        process.terminate()
+        raise
+    return process
+
+
+def print_step(seed_users: int, size: Optional[int], users: int, stats: Stats, elapsed: float):
+    if size is None:
+        print(f"\n▶ {users} users")
+    else:
+        print(f"\n▶ {users} users, {seed_users} seeded users ({size / 1024 / 1024:.1f} MB of data files)")
+    print(f"   {'Endpoint':<45} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for endpoint in sorted(stats.latencies):
+        values = stats.latencies[endpoint]
+        error_rate = stats.errors[endpoint] / len(values) * 100
+        print(f"   {endpoint:<45} {len(values) / elapsed:>8.1f} {percentile(values, 50) * 1000:>8.1f} "
+              f"{percentile(values, 95) * 1000:>8.1f} {percentile(values, 99) * 1000:>8.1f} "
+              f"{error_rate:>6.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', default='1,10,50', help='comma-separated concurrent user counts')
+    parser.add_argument('--seed-users', default='0,50,200', help='comma-separated pre-seeded user counts')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per step')
+    parser.add_argument('--think-ms', type=int, default=50, help='max think time between actions')
+    parser.add_argument('--port', type=int, default=10099)
+    parser.add_argument('--url', help='test an already running server instead (no seeding)')
+    args = parser.parse_args()
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    user_counts = [int(value) for value in args.users.split(',')]
+    seed_counts = [0] if args.url else [int(value) for value in args.seed_users.split(',')]
+
+    print("\n" + "="*80)
+    print("API LOAD TEST")
+    print("="*80)
+
+    summary = []
+    for seed_users in seed_counts:
+        data_dir = None
+        process = None
+        if args.url:
+            target = urlsplit(args.url)
+            host, port = target.hostname, target.port or 80
+        else:
+            data_dir = tempfile.mkdtemp(prefix='ellinaki-load-')
+            seed_data_dir(data_dir, seed_users, entries)
+            host, port = '127.0.0.1', args.port
+            process = start_server(data_dir, port)
+
+        try:
+            for users in user_counts:
+                size = data_dir_size(data_dir) if data_dir else None
+                stats, elapsed = asyncio.run(run_step(host, port, users, args.duration, args.think_ms,
+                                                      entries, seed_users * 1000 + users))
+                print_step(seed_users, size, users, stats, elapsed)
+
+                all_latencies = [value for values in stats.latencies.values() for value in values]
+                summary.append({
+                    'seed_users': seed_users,
+                    'users': users,
+                    'throughput': len(all_latencies) / elapsed,
+                    'p95': percentile(all_latencies, 95),
+                    'errors': sum(stats.errors.values()) / max(len(all_latencies), 1),
+                })
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+            if data_dir is not None:
+                shutil.rmtree(data_dir, ignore_errors=True)
+
+    print("\n" + "="*80)
+    print("SUMMARY")
+    print("="*80)
+    print(f"\n{'Seeded':<10} {'Users':<8} {'req/s':>8} {'p95 ms':>9} {'errors':>8}")
+    print("-" * 80)
+    # Compare each row with the step before it along one axis only: more users on the same
+    # seeded data, or the same users on more seeded data
+    by_step = {(row['seed_users'], row['users']): row for row in summary}
+    for row in summary:
+        seed_index = seed_counts.index(row['seed_users'])
+        user_index = user_counts.index(row['users'])
+        neighbours = []
+        if user_index:
+            neighbours.append(('fewer users', by_step.get((row['seed_users'], user_counts[user_index - 1]))))
+        if seed_index:
+            neighbours.append(('less seeded data', by_step.get((seed_counts[seed_index - 1], row['users']))))
+        jumps = [f"p95 jumped {row['p95'] / previous['p95']:.1f}x vs. {label}"
+                 for label, previous in neighbours
+                 if previous is not None and previous['p95'] > 0 and row['p95'] > CLIFF_FACTOR * previous['p95']]
+        print(f"{row['seed_users']:<10} {row['users']:<8} {row['throughput']:>8.1f} "
+              f"{row['p95'] * 1000:>9.1f} {row['errors'] * 100:>7.1f}%"
+              + (f"   ⚠️  {'; '.join(jumps)}" if jumps else ""))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Publish the dictionary and its indexes as a versioned, checksummed artifact
+The server watches the `current` pointer and hot-swaps to the new version
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from build_dictionary_index import DICTIONARY_FILE, ROOT_DIR, build_index, write_index
+
+DATA_DIR = os.environ.get('DATA_DIR', os.path.join(ROOT_DIR, 'data'))
+ARTIFACTS_DIR = os.path.join(DATA_DIR, 'dictionary')
+CURRENT_FILE = os.path.join(ARTIFACTS_DIR, 'current')
+
+# Old versions kept around for rollback (the current one is always kept)
+KEEP_VERSIONS = 5
+
+# Staging directories older than this are left over from a crashed publish
+STALE_STAGING_SECONDS = 3600
+
+DICTIONARY_NAME = 'dictionary.json'
+INDEX_NAME = 'dictionary-index.json'
+MANIFEST_NAME = 'manifest.json'
+
+
+def sha256_file(path: str) -> str:
+    """Hex SHA-256 of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_current_version() -> str:
+    """Version the `current` pointer names, or "" if nothing is published yet"""
+    try:
+        with open(CURRENT_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get('version', '')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return ""
+
+
+def write_atomic(path: str, content: str):
+    """Write through a temp file and rename so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def publish(entries: List[Dict]) -> Dict:
+    """
+    Write a new version directory and flip `current` to it
+
+    The version is the UTC build time plus the start of the dictionary checksum.
+    Distractor tables are not published: flashcards use the copy bundled with
+    the app, so a new version only matters to the server's dictionary and index.
+    Files are staged in a hidden directory and renamed into place, so a version
+    directory either exists complete or not at all. Publishing the same
+    dictionary twice within a second reuses the version already on disk.
+    """
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+
+    dictionary_bytes = json.dumps(entries, ensure_ascii=False, indent=2).encode('utf-8')
+    dictionary_sha256 = hashlib.sha256(dictionary_bytes).hexdigest()
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    version = f"{stamp}-{dictionary_sha256[:8]}"
+
+    version_dir = os.path.join(ARTIFACTS_DIR, version)
+    if os.path.isdir(version_dir):
+        with open(os.path.join(version_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['files'][DICTIONARY_NAME]['sha256'] != dictionary_sha256:
+            raise RuntimeError(f"version {version} already exists with a different dictionary")
+        write_atomic(CURRENT_FILE, json.dumps({'version': version}))
+        return manifest
+
+    # Unique per process, so concurrent publishes never share a staging directory
+    staging_dir = os.path.join(ARTIFACTS_DIR, f".{version}.{os.getpid()}.tmp")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+
+    with open(os.path.join(staging_dir, DICTIONARY_NAME), 'wb') as f:
+        f.write(dictionary_bytes)
+    write_index(build_index(entries), os.path.join(staging_dir, INDEX_NAME))
+
+    manifest = {
+        'version': version,
+        'created': datetime.now(timezone.utc).isoformat(),
+        'entries': len(entries),
+        'files': {
+            name: {
+                'sha256': sha256_file(os.path.join(staging_dir, name)),
+                'bytes': os.path.getsize(os.path.join(staging_dir, name)),
+            }
+            for name in (DICTIONARY_NAME, INDEX_NAME)
+        },
+    }
+    with open(os.path.join(staging_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    try:
+        os.rename(staging_dir, version_dir)
+    except OSError:
+        # A concurrent publish of the same dictionary got there first
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        if not os.path.isdir(version_dir):
+            raise
+    write_atomic(CURRENT_FILE, json.dumps({'version': version}))
+
+    return manifest
+
+
+def prune_versions(keep: int = KEEP_VERSIONS) -> List[str]:
+    """
+    Delete the oldest version directories beyond `keep`, never the current one,
+    and staging directories left behind by publishes that did not finish
+    """
+    current = read_current_version()
+    removed = []
+    for name in os.listdir(ARTIFACTS_DIR):
+        path = os.path.join(ARTIFACTS_DIR, name)
+        if (name.startswith('.') and name.endswith('.tmp') and os.path.isdir(path)
+                and time.time() - os.path.getmtime(path) > STALE_STAGING_SECONDS):
+            shutil.rmtree(path)
+            removed.append(name)
+
+    versions = sorted(
+        name for name in os.listdir(ARTIFACTS_DIR)
+        if not name.startswith('.') and os.path.isdir(os.path.join(ARTIFACTS_DIR, name))
+    )
+
+    for name in versions[:-keep] if keep > 0 else versions:
+        if name != current:
+            shutil.rmtree(os.path.join(ARTIFACTS_DIR, name))
+            removed.append(name)
+    return removed
+
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("PUBLISHING DICTIONARY")
+    print("="*80)
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    previous = read_current_version()
+    start = time.perf_counter()
+    manifest = publish(entries)
+    removed = prune_versions()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nPrevious version: {previous or '(none)'}")
+    print(f"New version:      {manifest['version']} ({manifest['entries']} entries)")
+    for name, info in manifest['files'].items():
+        print(f"   {name}: {info['bytes'] / 1024:.0f} KB, sha256 {info['sha256'][:16]}…")
+    if removed:
+        print(f"\n🗑  Pruned {len(removed)} old version(s): {', '.join(removed)}")
+    print(f"\n⏱  Published in {elapsed:.2f}s")
+    print(f"📌 {CURRENT_FILE} -> {manifest['version']}")
+    print("\nA running server picks up the new version without a restart.")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Reverse English -> Greek inverted index over dictionary glosses
+Tokenizes "buyer, purchaser, shopper" style glosses into token -> entry id postings
+"""
+
+import json
+import math
+import random
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from greek_text import LEVEL_RANK, LEVELS
+
+TOP_K = 10
+
+# Words that carry no meaning on their own in a gloss
+STOPWORDS = {
+    'a', 'an', 'the', 'of', 'to', 'be', 'sb', 'sth', 'smb', 'someone', 'something',
+}
+
+
+# Words whose ending only looks like a suffix
+STEM_EXCEPTIONS = {
+    'news', 'series', 'species', 'means', 'always', 'perhaps', 'towards', 'afterwards',
+    'physics', 'mathematics', 'politics', 'economics', 'athletics', 'gymnastics',
+    'clothes', 'trousers', 'scissors', 'glasses', 'thanks', 'lens', 'bus', 'gas',
+}
+
+VOWELS = 'aeiou'
+
+
+def _restore_e(stem_: str) -> str:
+    """
+    "lov" -> "love", "mak" -> "make": a one-syllable stem ending
+    consonant-vowel-consonant lost a silent e to -ed/-ing
+    """
+    if (len(stem_) >= 3 and stem_[-1] not in VOWELS + 'wxy' and stem_[-2] in VOWELS
+            and stem_[-3] not in VOWELS
+            and sum(1 for a, b in zip(' ' + stem_, stem_) if b in VOWELS and a not in VOWELS) == 1):
+        return stem_ + 'e'
+    return stem_
+
+
+def stem(token: str) -> str:
+    """
+    Light suffix stripping so "shopper"/"shoppers" and "love"/"loved"/"loving" meet
+
+    Deliberately conservative: only plurals and -ing/-ed. Words keep their
+    final e ("made" stays apart from "mad"); the e is restored after -ed/-ing.
+    """
+    if token in STEM_EXCEPTIONS:
+        return token
+
+    if len(token) > 4 and token.endswith('ies'):
+        token = token[:-3] + 'y'
+    elif token.endswith(('sses', 'xes', 'ches', 'shes')):
+        token = token[:-2]
+    elif len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        token = token[:-1]
+
+    for suffix in ('ing', 'ed'):
+        if not token.endswith(suffix) or token.endswith('eed'):
+            continue
+        remaining = token[:-len(suffix)]
+        # "string" and "bring" have no stem left to speak of
+        if len(remaining) < 3 or not any(ch in VOWELS + 'y' for ch in remaining):
+            break
+        # "shopping" -> "shopp" -> "shop"
+        if remaining[-1] == remaining[-2] and remaining[-1] not in VOWELS + 'lsz':
+            return remaining[:-1]
+        return _restore_e(remaining)
+
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, drop possessives and stopwords, stem what is left"""
+    text = text.lower().replace('’', "'")
+    text = re.sub(r"'s\b", '', text)
+    return [stem(word) for word in re.findall(r'[a-z0-9]+', text) if word not in STOPWORDS]
+
+
+def split_glosses(english: str) -> List[List[str]]:
+    """
+    Split a gloss field into tokenized senses
+
+    "to poke, to nudge"            -> [["poke"], ["nudge"]]
+    "slender-billed curlew [bird]" -> [["slender", "bill", "curlew"]]
+    Parenthetical and bracketed notes are dropped; empty senses are skipped.
+    """
+    english = re.sub(r'\([^)]*\)|\[[^\]]*\]', ' ', english)
+    senses = []
+    for part in re.split(r'[,;]', english):
+        part = re.sub(r'^\s*to\s+', '', part)
+        tokens = tokenize(part)
+        if tokens:
+            senses.append(tokens)
+    return senses
+
+
+def build_reverse_index(entries: List[Dict]) -> Dict:
+    """
+    Build token -> [[entry_id, weight], ...] postings
+
+    The weight is 1 / (number of tokens in the sense), taking the best sense:
+    "dear" scores higher for "dear, darling" than for "dear friend".
+    Postings are sorted by entry id so the output is deterministic.
+    """
+    weights = defaultdict(dict)
+    for entry_id, entry in enumerate(entries):
+        for sense in split_glosses(entry.get('english', '')):
+            weight = 1 / len(sense)
+            for token in sense:
+                if weight > weights[token].get(entry_id, 0):
+                    weights[token][entry_id] = weight
+
+    postings = {
+        token: [[entry_id, round(weight, 3)] for entry_id, weight in sorted(by_entry.items())]
+        for token, by_entry in sorted(weights.items())
+    }
+
+    return {
+        'entries': len(entries),
+        'levels': [LEVEL_RANK.get(entry.get('level'), len(LEVELS)) for entry in entries],
+        'postings': postings,
+    }
+
+
+class ReverseIndex:
+    """Query side of the reverse index built by build_reverse_index"""
+
+    def __init__(self, index: Dict):
+        self.entries = index['entries']
+        self.levels = index['levels']
+        self.postings = index['postings']
+
+    @classmethod
+    def load(cls, path: str) -> 'ReverseIndex':
+        """Load the reverse section of a dictionary index file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)['reverse'])
+
+    def search(self, query: str, k: int = TOP_K) -> List[Tuple[int, float]]:
+        """
+        Return up to k (entry_id, score) pairs for an English query
+
+        Each query token contributes idf * weight, so entries matching more
+        (and rarer) tokens rank first. Ties go to the easier level, then entry id.
+        """
+        scores = defaultdict(float)
+        for token in set(tokenize(query)):
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + self.entries / len(posting))
+            for entry_id, weight in posting:
+                scores[entry_id] += idf * weight
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.levels[item[0]], item[0]))
+        return [(entry_id, round(score, 3)) for entry_id, score in ranked[:k]]
+
+
+def linear_search(entries: List[Dict], query: str) -> List[int]:
+    """Reference implementation: substring scan of every english field"""
+    query = query.lower()
+    return [entry_id for entry_id, entry in enumerate(entries) if query in entry['english'].lower()]
+
+
+if __name__ == "__main__":
+    from build_dictionary_index import DICTIONARY_FILE, INDEX_FILE
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    reverse = ReverseIndex.load(INDEX_FILE)
+
+    random.seed(0)
+    queries = [re.sub(r'^to ', '', entry['english'].split(',')[0].strip())
+               for entry in random.sample(entries, 500)]
+
+    print("\n" + "="*80)
+    print("REVERSE INDEX BENCHMARK")
+    print("="*80)
+
+    start = time.perf_counter()
+    for query in queries:
+        reverse.search(query)
+    indexed = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    for query in queries:
+        linear_search(entries, query)
+    linear = (time.perf_counter() - start) / len(queries)
+
+    print(f"\nQueries: {len(queries)} over {len(entries)} entries, {len(reverse.postings)} tokens")
+    print(f"   Indexed: {indexed * 1e6:8.1f} µs/query")
+    print(f"   Linear:  {linear * 1e6:8.1f} µs/query ({linear / indexed:.0f}x slower)")
+
+    for query in ('to love', 'shopper', 'dear friend'):
+        words = [entries[entry_id]['greek'] for entry_id, _ in reverse.search(query, 5)]
+        print(f"\n   {query}: {', '.join(words)}")
@@ -2,6 +2,7 @@
 import express from 'express'
 import fs from 'fs'
 import path from 'path'
+import { Worker } from 'worker_threads'
 import multer from 'multer'
 import xlsx from 'xlsx'
 
@@ -13,6 +14,7 @@ const LISTS_FILE = path.join(DATA_DIR, 'word-lists.json')
 const CUSTOM_WORDS_FILE = path.join(DATA_DIR, 'custom-words.json')
 const DAILY_PRACTICE_FILE = path.join(DATA_DIR, 'daily-practice.json')
 const LEARNING_POINTS_FILE = path.join(DATA_DIR, 'learning-points.json')
+const REVIEW_SCHEDULE_FILE = path.join(DATA_DIR, 'review-schedule.json')
 
 // Ensure data directory exists
 if (!fs.existsSync(DATA_DIR)) {
@@ -184,16 +186,214 @@ const addLearningPoints = (userId, points) => {
   return allData[userId][today]
 }
 
-// Load dictionary at server start
-let dictionary = []
+// Dictionary state: words plus lookup indexes, swapped as one object on reload.
+// Published versions live in DATA_DIR/dictionary/<version>/ (see publish_dictionary.py)
+// and DATA_DIR/dictionary/current names the active one.
+const DICTIONARY_DIR = path.join(DATA_DIR, 'dictionary')
+const CURRENT_DICTIONARY_FILE = path.join(DICTIONARY_DIR, 'current')
+const DICTIONARY_POLL_INTERVAL = 5000
+const LEVELS = ['A1', 'A2', 'B1', 'B2']
+
+const buildDictionaryState = (version, words, searchIndex = null) => {
+  const byGreek = new Map()
+  const byLevel = Object.fromEntries(LEVELS.map(level => [level, []]))
+  words.forEach(word => {
+    if (!byGreek.has(word.greek)) byGreek.set(word.greek, word)
+    if (byLevel[word.level]) byLevel[word.level].push(word)
+  })
+  return { version, words, byGreek, byLevel, searchIndex, loadedAt: new Date().toISOString() }
+}
+
+// Load and validate a published version without touching the live state.
+// Reading, hashing, JSON.parse and validation run in a worker thread; the main
+// thread only pays for receiving the structured-clone result and building the lookups.
+const loadDictionaryVersion = (version) => new Promise((resolve, reject) => {
+  const worker = new Worker(new URL('./dictionary-loader.js', import.meta.url), {
+    workerData: { dictionaryDir: DICTIONARY_DIR, version }
+  })
+  worker.once('message', (message) => {
+    if (message.ok) {
+      resolve(buildDictionaryState(version, message.words, message.searchIndex))
+    } else {
+      reject(new Error(message.error))
+    }
+  })
+  worker.once('error', reject)
+  worker.once('exit', (code) => {
+    if (code !== 0) reject(new Error(`dictionary loader exited with code ${code}`))
+  })
+})
+
+const readCurrentDictionaryVersion = async () => {
+  try {
+    const pointer = JSON.parse(await fs.promises.readFile(CURRENT_DICTIONARY_FILE, 'utf8'))
+    return pointer.version || null
+  } catch (error) {
+    return null
+  }
+}
+
+// Load bundled dictionary at server start; a published version replaces it once loaded
+let dictionaryState = buildDictionaryState('bundled', [])
 try {
   const dictPath = path.join(process.cwd(), 'src/dictionary.json')
-  dictionary = JSON.parse(fs.readFileSync(dictPath, 'utf8'))
+  const words = JSON.parse(fs.readFileSync(dictPath, 'utf8'))
+  let searchIndex = null
+  try {
+    const indexPath = path.join(process.cwd(), 'src/dictionary-index.json')
+    const index = JSON.parse(fs.readFileSync(indexPath, 'utf8'))
+    if (index.entries === words.length) {
+      searchIndex = { entries: index.entries, autocomplete: index.autocomplete, reverse: index.reverse }
+    }
+  } catch (error) {
+    console.warn('Search index not available, autocomplete disabled:', error.message)
+  }
+  dictionaryState = buildDictionaryState('bundled', words, searchIndex)
   console.log('Dictionary loaded successfully')
 } catch (error) {
   console.error('Error loading dictionary:', error)
 }
 
+// Same normalization as greek_text.query_key: fold accents and final sigma,
+// drop punctuation, keep one trailing space so multi-word headwords narrow
+const autocompleteKey = (text) => {
+  let key = text.normalize('NFD').replace(/\p{M}/gu, '').toLowerCase().replace(/ς/g, 'σ')
+  key = key.replace(/[^\p{L}\p{N}_\s]/gu, '').replace(/\s+/g, ' ').trim()
+  if (key && /\s$/.test(text)) key += ' '
+  return key
+}
+
+const lowerBound = (keys, target, lo = 0) => {
+  let hi = keys.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (keys[mid] < target) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+// Top-k completions from the swapped-in autocomplete index (see autocomplete.py)
+const completePrefix = (prefix, k) => {
+  const index = dictionaryState.searchIndex && dictionaryState.searchIndex.autocomplete
+  if (!index) return null
+  k = Math.min(k, index.top_k)
+  const key = autocompleteKey(prefix)
+  if (!key || k <= 0) return []
+
+  // buckets is parsed JSON: "constructor" or "__proto__" must not hit Object.prototype
+  if (Object.hasOwn(index.buckets, key)) return index.buckets[key].slice(0, k)
+
+  // No bucket means the range holds at most top_k keys
+  const lo = lowerBound(index.keys, key)
+  const hi = lowerBound(index.keys, key + '\uffff', lo)
+  return [...new Set(index.ids.slice(lo, hi))]
+    .sort((a, b) => index.rank[a] - index.rank[b])
+    .slice(0, k)
+}
+
+let dictionaryReloading = false
+const failedDictionaryVersions = new Set()
+
+// Check the `current` pointer and swap in a new version if there is one.
+// A version that fails validation is remembered and skipped; the old state stays live.
+// English query tokens, the same way reverse_index.tokenize builds the postings:
+// lowercase, drop possessives and stopwords, strip plurals and -ing/-ed
+const ENGLISH_STOPWORDS = new Set(['a', 'an', 'the', 'of', 'to', 'be', 'sb', 'sth', 'smb', 'someone', 'something'])
+const STEM_EXCEPTIONS = new Set([
+  'news', 'series', 'species', 'means', 'always', 'perhaps', 'towards', 'afterwards',
+  'physics', 'mathematics', 'politics', 'economics', 'athletics', 'gymnastics',
+  'clothes', 'trousers', 'scissors', 'glasses', 'thanks', 'lens', 'bus', 'gas'
+])
+const VOWELS = 'aeiou'
+
+const restoreE = (stem) => {
+  if (stem.length < 3 || (VOWELS + 'wxy').includes(stem.at(-1)) || !VOWELS.includes(stem.at(-2)) ||
+      VOWELS.includes(stem.at(-3))) {
+    return stem
+  }
+  let syllables = 0
+  for (let i = 0; i < stem.length; i++) {
+    if (VOWELS.includes(stem[i]) && (i === 0 || !VOWELS.includes(stem[i - 1]))) syllables++
+  }
+  return syllables === 1 ? stem + 'e' : stem
+}
+
+const stemEnglish = (token) => {
+  if (STEM_EXCEPTIONS.has(token)) return token
+
+  if (token.length > 4 && token.endsWith('ies')) {
+    token = token.slice(0, -3) + 'y'
+  } else if (['sses', 'xes', 'ches', 'shes'].some(suffix => token.endsWith(suffix))) {
+    token = token.slice(0, -2)
+  } else if (token.length > 3 && token.endsWith('s') && !['ss', 'us', 'is'].some(suffix => token.endsWith(suffix))) {
+    token = token.slice(0, -1)
+  }
+
+  for (const suffix of ['ing', 'ed']) {
+    if (!token.endsWith(suffix) || token.endsWith('eed')) continue
+    const remaining = token.slice(0, -suffix.length)
+    if (remaining.length < 3 || ![...remaining].some(ch => (VOWELS + 'y').includes(ch))) break
+    if (remaining.at(-1) === remaining.at(-2) && !(VOWELS + 'lsz').includes(remaining.at(-1))) {
+      return remaining.slice(0, -1)
+    }
+    return restoreE(remaining)
+  }
+  return token
+}
+
+const tokenizeEnglish = (text) => {
+  const words = text.toLowerCase().replace(/’/g, "'").replace(/'s\b/g, '').match(/[a-z0-9]+/g) || []
+  return words.filter(word => !ENGLISH_STOPWORDS.has(word)).map(stemEnglish)
+}
+
+// English -> Greek search over the reverse index (see reverse_index.py): each query
+// token adds idf * weight, ties go to the easier level, then the entry id
+const searchEnglish = (query, k) => {
+  const index = dictionaryState.searchIndex && dictionaryState.searchIndex.reverse
+  if (!index) return null
+
+  const scores = new Map()
+  for (const token of new Set(tokenizeEnglish(query))) {
+    if (!Object.hasOwn(index.postings, token)) continue
+    const posting = index.postings[token]
+    const idf = Math.log(1 + index.entries / posting.length)
+    for (const [entryId, weight] of posting) {
+      scores.set(entryId, (scores.get(entryId) || 0) + idf * weight)
+    }
+  }
+
+  return [...scores.entries()]
+    .sort((a, b) => b[1] - a[1] || index.levels[a[0]] - index.levels[b[0]] || a[0] - b[0])
+    .slice(0, k)
+    .map(([entryId]) => entryId)
+}
+
+const reloadDictionary = async () => {
+  if (dictionaryReloading) return
+  dictionaryReloading = true
+  try {
+    const version = await readCurrentDictionaryVersion()
+    if (!version || version === dictionaryState.version || failedDictionaryVersions.has(version)) {
+      return
+    }
+    try {
+      const nextState = await loadDictionaryVersion(version)
+      const previousVersion = dictionaryState.version
+      dictionaryState = nextState
+      console.log(`Dictionary swapped: ${previousVersion} -> ${version} (${nextState.words.length} words)`)
+    } catch (error) {
+      failedDictionaryVersions.add(version)
+      console.error(`Dictionary version ${version} rejected, keeping ${dictionaryState.version}:`, error.message)
+    }
+  } finally {
+    dictionaryReloading = false
+  }
+}
+
+reloadDictionary()
+setInterval(reloadDictionary, DICTIONARY_POLL_INTERVAL).unref()
+
 // Helper function to group words by topic
 const groupWordsByTopic = (words) => {
   const topics = {
@@ -232,26 +432,108 @@ const groupWordsByTopic = (words) => {
   return grouped
 }
 
+// Spaced-repetition batch written by `python3 spaced_repetition.py batch`
+const readReviewSchedule = () => {
+  if (!fs.existsSync(REVIEW_SCHEDULE_FILE)) {
+    return {}
+  }
+  try {
+    const data = fs.readFileSync(REVIEW_SCHEDULE_FILE, 'utf8')
+    return JSON.parse(data)
+  } catch (error) {
+    console.error('Error reading review schedule file:', error)
+    return {}
+  }
+}
+
+// Fisher-Yates: unbiased, unlike sort(() => Math.random() - 0.5)
+const shuffle = (items) => {
+  const shuffled = [...items]
+  for (let i = shuffled.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1))
+    ;[shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]]
+  }
+  return shuffled
+}
+
+// Record a review of a word in a list (used by the spaced-repetition scheduler)
+const recordWordReview = (list, wordGreek, lapsed = false) => {
+  if (!list.wordReviews) {
+    list.wordReviews = {}
+  }
+  const review = list.wordReviews[wordGreek] || { reviews: 0, lapses: 0 }
+  if (lapsed) {
+    review.lapses += 1
+  } else {
+    review.reviews += 1
+  }
+  review.lastReviewed = new Date().toISOString()
+  list.wordReviews[wordGreek] = review
+}
+
+// Daily practice is not a stored list: a review done there is recorded on the list that
+// owns the word - one already tracking it, then one containing it, then its level list
+const DAILY_PRACTICE_LIST_ID = 'daily-practice'
+
+const findListForReview = (userLists, listId, wordGreek) => {
+  if (listId !== DAILY_PRACTICE_LIST_ID) {
+    return userLists.find(l => l.id === listId)
+  }
+  const tracking = userLists.find(l =>
+    (l.wordLearningPoints && Object.hasOwn(l.wordLearningPoints, wordGreek)) ||
+    (l.wordReviews && Object.hasOwn(l.wordReviews, wordGreek)))
+  if (tracking) return tracking
+
+  const containing = userLists.find(l => (l.words || []).some(w => w.greek === wordGreek))
+  if (containing) return containing
+
+  const word = dictionaryState.byGreek.get(wordGreek)
+  return word ? userLists.find(l => l.id === word.level.toLowerCase()) : undefined
+}
+
 // Generate daily practice words for a user
 const generateDailyWords = (userId, level, learnedWords = []) => {
-  // First, try to get words from topic lists
+  const learned = new Set(learnedWords)
+
   const listsData = readWordLists()
   const userLists = listsData[userId] || []
 
-  // Get all topic lists
+  // Words due for review, if the scheduler batch ran today (server-local calendar, like
+  // userData.date) for this level. Learned words reviewed since the batch are dropped;
+  // learned words still awaiting their review are what the schedule is for.
+  const schedule = readReviewSchedule()[userId]
+  if (schedule && schedule.level === level && schedule.generated &&
+      new Date(schedule.generated).toDateString() === new Date().toDateString()) {
+    const generated = Date.parse(schedule.generated)
+    const reviewedSince = (greek) => userLists.some(list => {
+      const review = list.wordReviews && list.wordReviews[greek]
+      return review && Date.parse(review.lastReviewed) >= generated
+    })
+    const dueWords = schedule.words
+      .filter(greek => !learned.has(greek) || !reviewedSince(greek))
+      .map(greek => dictionaryState.byGreek.get(greek))
+      .filter(w => w != null)
+    if (dueWords.length > 0) {
+      return {
+        words: dueWords,
+        topic: 'Spaced Repetition Review'
+      }
+    }
+  }
+
+  // Otherwise, try words from topic lists
   const topicLists = userLists.filter(list => list.isTopic === true)
 
   // Collect all unlearned words from topic lists
   let topicUnlearnedWords = []
   topicLists.forEach(topicList => {
-    const unlearnedInList = topicList.words.filter(w => !learnedWords.includes(w.greek))
+    const unlearnedInList = topicList.words.filter(w => !learned.has(w.greek))
     topicUnlearnedWords = topicUnlearnedWords.concat(unlearnedInList)
   })
 
   // If we have unlearned topic words, prioritize them
   if (topicUnlearnedWords.length > 0) {
-    const shuffled = [...topicUnlearnedWords].sort(() => Math.random() - 0.5)
-    const selectedWords = shuffled.slice(0, 10)
+    const selectedWords = shuffle(topicUnlearnedWords).slice(0, 10)
 
     return {
       words: selectedWords,
@@ -260,15 +542,14 @@ const generateDailyWords = (userId, level, learnedWords = []) => {
   }
 
   // Otherwise, fall back to level-based words
-  const levelWords = dictionary.filter(w => w.level === level)
-  const unlearnedWords = levelWords.filter(w => !learnedWords.includes(w.greek))
+  const levelWords = dictionaryState.byLevel[level] || []
+  const unlearnedWords = levelWords.filter(w => !learned.has(w.greek))
 
   if (unlearnedWords.length === 0) {
     return { words: [], topic: null }
   }
 
-  const shuffled = [...unlearnedWords].sort(() => Math.random() - 0.5)
-  const selectedWords = shuffled.slice(0, 10)
+  const selectedWords = shuffle(unlearnedWords).slice(0, 10)
 
   return {
     words: selectedWords,
@@ -387,7 +668,7 @@ const ensureDefaultLists = (userId, userLists) => {
     if (!topicList) {
       // Create new topic list
       const words = topicDef.greekWords
-        .map(greekWord => dictionary.find(w => w.greek === greekWord))
+        .map(greekWord => dictionaryState.byGreek.get(greekWord))
         .filter(w => w != null)
 
       if (words.length > 0) {
@@ -411,7 +692,7 @@ const ensureDefaultLists = (userId, userLists) => {
   levels.forEach(level => {
     let levelList = userLists.find(list => list.id === level.toLowerCase())
     if (!levelList) {
-      const levelWords = dictionary.filter(word => word.level === level)
+      const levelWords = dictionaryState.byLevel[level] || []
       levelList = {
         id: level.toLowerCase(),
         name: `${level} Words`,
@@ -425,7 +706,7 @@ const ensureDefaultLists = (userId, userLists) => {
       updated = true
     } else if (levelList.words.length === 0) {
       // Repopulate if empty
-      const levelWords = dictionary.filter(word => word.level === level)
+      const levelWords = dictionaryState.byLevel[level] || []
       levelList.words = levelWords.map(word => ({ ...word }))
       levelList.isReadOnly = true
       updated = true
@@ -742,7 +1023,7 @@ app.post('/api/lists/:userId/:listId/learned', (req, res) => {
 
   ensureDefaultLists(userId, allData[userId])
 
-  const list = allData[userId].find(l => l.id === listId)
+  const list = findListForReview(allData[userId], listId, wordGreek)
   if (!list) {
     return res.status(404).json({ error: 'List not found' })
   }
@@ -756,6 +1037,7 @@ app.post('/api/lists/:userId/:listId/learned', (req, res) => {
   const currentPoints = list.wordLearningPoints[wordGreek] || 0
   const newPoints = Math.min(currentPoints + 1, 4)
   list.wordLearningPoints[wordGreek] = newPoints
+  recordWordReview(list, wordGreek)
 
   // Track daily learning points (+1 point for each mark as learned action)
   addLearningPoints(userId, 1)
@@ -778,17 +1060,18 @@ app.delete('/api/lists/:userId/:listId/learned/:wordGreek', (req, res) => {
     return res.status(404).json({ error: 'User not found' })
   }
 
-  const list = allData[userId].find(l => l.id === listId)
+  const decodedWord = decodeURIComponent(wordGreek)
+
+  const list = findListForReview(allData[userId], listId, decodedWord)
   if (!list) {
     return res.status(404).json({ error: 'List not found' })
   }
 
-  const decodedWord = decodeURIComponent(wordGreek)
-
   // Reset learning points to 0
   if (list.wordLearningPoints) {
     delete list.wordLearningPoints[decodedWord]
   }
+  recordWordReview(list, decodedWord, true)
 
   // Update learnedWords for backwards compatibility
   list.learnedWords = list.learnedWords.filter(w => w !== decodedWord)
@@ -1143,6 +1426,43 @@ app.put('/api/daily-practice/:userId/level', (req, res) => {
   })
 })
 
+// Dictionary version currently served (changes when a new version is published)
+app.get('/api/dictionary/version', (req, res) => {
+  res.json({
+    version: dictionaryState.version,
+    words: dictionaryState.words.length,
+    loadedAt: dictionaryState.loadedAt
+  })
+})
+
+// Search-as-you-type: top completions for a Greek or Greeklish prefix, easiest level first
+app.get('/api/dictionary/autocomplete', (req, res) => {
+  const prefix = typeof req.query.q === 'string' ? req.query.q : ''
+  const k = parseInt(req.query.k, 10) || 10
+  const ids = completePrefix(prefix, k)
+  if (ids === null) {
+    return res.status(503).json({ error: 'Autocomplete index not loaded' })
+  }
+  res.json({
+    version: dictionaryState.version,
+    words: ids.map(id => dictionaryState.words[id])
+  })
+})
+
+// English search: Greek entries whose glosses best match an English query
+app.get('/api/dictionary/search', (req, res) => {
+  const query = typeof req.query.q === 'string' ? req.query.q : ''
+  const k = Math.min(parseInt(req.query.k, 10) || 10, 50)
+  const ids = searchEnglish(query, k)
+  if (ids === null) {
+    return res.status(503).json({ error: 'Search index not loaded' })
+  }
+  res.json({
+    version: dictionaryState.version,
+    words: ids.map(id => dictionaryState.words[id])
+  })
+})
+
 // Handle React Router - serve index.html for all routes (must be last)
 app.get('*', (req, res) => {
   res.sendFile(path.join(process.cwd(), 'dist', 'index.html'))
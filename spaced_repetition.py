@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Spaced-repetition scheduler for daily practice
+Keeps a per-user priority queue of words keyed by next due time
+
+Usage:
+    python3 spaced_repetition.py batch      # recompute today's words for every user
+    python3 spaced_repetition.py simulate   # benchmark many users x the full dictionary
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import random
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from build_dictionary_index import DICTIONARY_FILE, ROOT_DIR
+from greek_text import LEVEL_RANK, LEVELS
+
+DATA_DIR = os.environ.get('DATA_DIR', os.path.join(ROOT_DIR, 'data'))
+LISTS_FILE = os.path.join(DATA_DIR, 'word-lists.json')
+DAILY_PRACTICE_FILE = os.path.join(DATA_DIR, 'daily-practice.json')
+SCHEDULE_FILE = os.path.join(DATA_DIR, 'review-schedule.json')
+
+DAILY_WORDS = 10
+MAX_POINTS = 4
+
+# Days until the next review for 0..4 learning points
+BASE_INTERVAL_DAYS = [0, 1, 3, 7, 21]
+
+DAY = 86400
+
+
+def review_interval(points: int, reviews: int = 0, lapses: int = 0) -> float:
+    """
+    Seconds until a word with these learning points should be seen again
+
+    Every successful review stretches the interval by 10% (up to 2x);
+    every lapse (the word was reset to unlearned) halves it.
+    """
+    points = max(0, min(points, MAX_POINTS))
+    growth = 1 + 0.1 * min(reviews, 10)
+    return BASE_INTERVAL_DAYS[points] * DAY * growth / (1 + lapses)
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """ISO timestamp (as written by the server) to epoch seconds"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+def shuffle_key(user_id: str, word: str) -> int:
+    """Stable per-user pseudo-random order for words that are otherwise tied"""
+    return int.from_bytes(hashlib.blake2b(f"{user_id}\0{word}".encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class UserSchedule:
+    """
+    Min-heap of (due, points, level, shuffle, word) for one user
+
+    Stale heap entries are skipped lazily: each word remembers the due time of
+    its live entry, so re-scheduling is a push rather than a search.
+    """
+
+    def __init__(self, user_id: str, now: float):
+        self.user_id = user_id
+        self.now = now
+        self.heap: List[Tuple] = []
+        self.live: Dict[str, float] = {}
+        self.state: Dict[str, Dict] = {}
+
+    def add(self, word: str, level: str, points: int = 0, last_review: Optional[float] = None,
+            reviews: int = 0, lapses: int = 0):
+        """
+        Queue a word; words never reviewed are due now, after anything overdue
+
+        Call heapify() once after the bulk adds.
+        """
+        self.state[word] = {'level': level, 'points': points, 'reviews': reviews, 'lapses': lapses}
+        due = self.now if last_review is None else last_review + review_interval(points, reviews, lapses)
+        self.heap.append(self._entry(word, due))
+
+    def _entry(self, word: str, due: float) -> Tuple:
+        state = self.state[word]
+        self.live[word] = due
+        return (due, state['points'], LEVEL_RANK.get(state['level'], len(LEVELS)),
+                shuffle_key(self.user_id, word), word)
+
+    def heapify(self):
+        """Turn the bulk-added entries into a heap in O(n)"""
+        heapq.heapify(self.heap)
+
+    def pick(self, k: int, now: float) -> List[str]:
+        """
+        Pop up to k words that are due at `now`, most overdue first - O(k log n)
+
+        Picked words are pushed back a day so they are not offered twice
+        before the user has reviewed them.
+        """
+        picked = []
+        while self.heap and len(picked) < k:
+            due, _, _, _, word = self.heap[0]
+            if due > now:
+                break
+            heapq.heappop(self.heap)
+            if self.live.get(word) == due:
+                picked.append(word)
+
+        for word in picked:
+            self._reschedule(word, now + DAY)
+        return picked
+
+    def record_review(self, word: str, points: int, now: float):
+        """Apply a review result and queue the word at its next due time"""
+        state = self.state[word]
+        if points < state['points']:
+            state['lapses'] += 1
+        else:
+            state['reviews'] += 1
+        state['points'] = points
+        self._reschedule(word, now + review_interval(points, state['reviews'], state['lapses']))
+
+    def _reschedule(self, word: str, due: float):
+        heapq.heappush(self.heap, self._entry(word, due))
+
+
+def user_word_state(user_lists: List[Dict]) -> Dict[str, Dict]:
+    """
+    Merge learning points and review history for a user across all their lists
+
+    Points take the best list, review counts add up, the last review is the latest.
+    `created` is the earliest creation time of a list holding the word (0 if unknown).
+    """
+    merged = {}
+    for user_list in user_lists:
+        points = user_list.get('wordLearningPoints') or {}
+        history = user_list.get('wordReviews') or {}
+        created = parse_time(user_list.get('createdAt')) or 0.0
+        for word in set(points) | set(history):
+            state = merged.setdefault(word, {'points': 0, 'last': None, 'reviews': 0, 'lapses': 0,
+                                             'created': created})
+            state['created'] = min(state['created'], created)
+            review = history.get(word) or {}
+            state['points'] = max(state['points'], points.get(word, 0))
+            state['reviews'] += review.get('reviews', 0)
+            state['lapses'] += review.get('lapses', 0)
+            last = parse_time(review.get('lastReviewed'))
+            if last is not None and (state['last'] is None or last > state['last']):
+                state['last'] = last
+    return merged
+
+
+def build_user_schedule(user_id: str, user_lists: List[Dict], level_words: List[Dict],
+                        by_greek: Dict[str, Dict], now: float) -> UserSchedule:
+    """
+    Queue every word a user can practice: their daily level, topic lists,
+    and anything they have already started learning
+    """
+    schedule = UserSchedule(user_id, now)
+    history = user_word_state(user_lists)
+
+    candidates = {word['greek']: word for word in level_words}
+    for user_list in user_lists:
+        if user_list.get('isTopic'):
+            candidates.update((word['greek'], word) for word in user_list.get('words', []))
+    for word in history:
+        if word not in candidates and word in by_greek:
+            candidates[word] = by_greek[word]
+
+    for greek, word in candidates.items():
+        state = history.get(greek)
+        if state is None:
+            schedule.add(greek, word.get('level'))
+        elif state['points'] >= MAX_POINTS and state['last'] is None:
+            # Learned before review history existed: date it from its list so it
+            # becomes due once, instead of being pushed back on every batch run
+            schedule.add(greek, word.get('level'), state['points'], state['created'],
+                         state['reviews'], state['lapses'])
+        else:
+            schedule.add(greek, word.get('level'), state['points'], state['last'],
+                         state['reviews'], state['lapses'])
+
+    schedule.heapify()
+    return schedule
+
+
+def read_json(path: str) -> Dict:
+    """Read a server data file, treating a missing file as empty"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_batch(entries: List[Dict], now: float, k: int = DAILY_WORDS) -> Dict:
+    """Recompute today's review batch for every user with daily practice set up"""
+    lists_data = read_json(LISTS_FILE)
+    practice_data = read_json(DAILY_PRACTICE_FILE)
+
+    by_greek = {}
+    by_level = {level: [] for level in LEVELS}
+    for entry in entries:
+        by_greek.setdefault(entry['greek'], entry)
+        by_level.setdefault(entry.get('level'), []).append(entry)
+
+    today = datetime.fromtimestamp(now, timezone.utc).date().isoformat()
+    generated = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    schedules = {}
+    for user_id, practice in practice_data.items():
+        user_lists = lists_data.get(user_id, [])
+        schedule = build_user_schedule(user_id, user_lists, by_level.get(practice.get('level'), []),
+                                       by_greek, now)
+        schedules[user_id] = {
+            'date': today,
+            'generated': generated,
+            'level': practice.get('level'),
+            'words': schedule.pick(k, now),
+        }
+
+    tmp_file = f"{SCHEDULE_FILE}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(schedules, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, SCHEDULE_FILE)
+
+    return schedules
+
+
+def simulate(entries: List[Dict], users: int, days: int, k: int = DAILY_WORDS, seed: int = 0) -> Dict:
+    """
+    Run `users` learners over the full dictionary for `days` days
+
+    Each day every user picks k due words and answers each correctly with a
+    probability that grows with the word's points. Returns timing totals.
+    """
+    rng = random.Random(seed)
+    start_time = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    build_start = time.perf_counter()
+    schedules = []
+    for user in range(users):
+        schedule = UserSchedule(f"user-{user}", start_time)
+        for entry in entries:
+            schedule.add(entry['greek'], entry.get('level'))
+        schedule.heapify()
+        schedules.append(schedule)
+    build_seconds = time.perf_counter() - build_start
+
+    pick_seconds = 0.0
+    picks = 0
+    reviews = 0
+    for day in range(days):
+        now = start_time + day * DAY
+        for schedule in schedules:
+            pick_start = time.perf_counter()
+            words = schedule.pick(k, now)
+            pick_seconds += time.perf_counter() - pick_start
+            picks += 1
+
+            for word in words:
+                points = schedule.state[word]['points']
+                if rng.random() < 0.6 + 0.1 * points:
+                    points = min(points + 1, MAX_POINTS)
+                else:
+                    points = max(points - 1, 0)
+                schedule.record_review(word, points, now)
+                reviews += 1
+
+    return {
+        'users': users,
+        'words': len(entries),
+        'days': days,
+        'build_seconds': build_seconds,
+        'pick_seconds': pick_seconds,
+        'picks': picks,
+        'reviews': reviews,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('batch', help="recompute today's words for every user")
+    simulate_parser = subparsers.add_parser('simulate', help='benchmark users x the full dictionary')
+    simulate_parser.add_argument('--users', type=int, default=100)
+    simulate_parser.add_argument('--days', type=int, default=30)
+    args = parser.parse_args()
+
+    with open(DICTIONARY_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    if args.command == 'batch':
+        print("\n" + "="*80)
+        print("SPACED REPETITION BATCH")
+        print("="*80)
+
+        start = time.perf_counter()
+        schedules = run_batch(entries, time.time())
+        elapsed = time.perf_counter() - start
+
+        print(f"\nUsers scheduled: {len(schedules)}")
+        print(f"⏱  Done in {elapsed:.2f}s")
+        print(f"💾 Saved to: {SCHEDULE_FILE}")
+    else:
+        print("\n" + "="*80)
+        print(f"SPACED REPETITION SIMULATION: {args.users} users x {len(entries)} words x {args.days} days")
+        print("="*80)
+
+        stats = simulate(entries, args.users, args.days)
+
+        print(f"\nBuild: {stats['build_seconds']:.2f}s "
+              f"({stats['build_seconds'] / stats['users'] * 1000:.1f} ms per user)")
+        print(f"Pick:  {stats['pick_seconds'] / stats['picks'] * 1e6:.1f} µs per daily batch "
+              f"({stats['picks']} batches)")
+        print(f"Reviews simulated: {stats['reviews']}")
@@ -11,6 +11,7 @@ import Input from '../components/common/Input'
 import Badge from '../components/common/Badge'
 import { getCustomWords } from '../utils/customWords'
 import { getUserId } from '../utils/storage'
+import { searchDictionaryByEnglish, scanDictionaryByEnglish } from '../utils/dictionarySearch'
 import './Dictionary.css'
 
 const Dictionary = () => {
@@ -23,6 +24,7 @@ const Dictionary = () => {
   const [showAuthModal, setShowAuthModal] = useState(false)
   const [highlightedIndex, setHighlightedIndex] = useState(-1)
   const [customWords, setCustomWords] = useState([])
+  const [englishMatches, setEnglishMatches] = useState([])
   const inputRef = useRef(null)
   const [showGuide, setShowGuide] = useState(true)
 
@@ -39,6 +41,30 @@ const Dictionary = () => {
     setShowGuide(false)
   }
 
+  // English matches come from the server's reverse index ("loving" finds "love")
+  useEffect(() => {
+    const term = searchTerm.trim()
+    if (!term) {
+      setEnglishMatches([])
+      return
+    }
+
+    const controller = new AbortController()
+    const timer = setTimeout(async () => {
+      try {
+        const words = await searchDictionaryByEnglish(term, 10, controller.signal)
+        setEnglishMatches(words ?? scanDictionaryByEnglish(dictionaryData, term))
+      } catch (error) {
+        // Superseded by a newer search term
+      }
+    }, 150)
+
+    return () => {
+      clearTimeout(timer)
+      controller.abort()
+    }
+  }, [searchTerm])
+
   const filteredSuggestions = useMemo(() => {
     if (!searchTerm.trim()) {
       return []
@@ -46,22 +72,27 @@ const Dictionary = () => {
 
     const term = searchTerm.toLowerCase().trim()
 
-    // Merge dictionary and custom words
-    const allWords = [...dictionaryData, ...customWords]
+    // Greek matches first, then English matches, then custom words (they are not in the index)
+    const greekMatches = dictionaryData.filter(
+      (word) => word.greek.toLowerCase().includes(term) ||
+        (word.greek_normalized && word.greek_normalized.toLowerCase().includes(term))
+    )
+    const customMatches = customWords.filter(
+      (word) => word.greek.toLowerCase().includes(term) ||
+        (word.greek_normalized && word.greek_normalized.toLowerCase().includes(term)) ||
+        word.english.toLowerCase().includes(term)
+    )
 
-    return allWords
-      .filter(
-        (word) => {
-          // Filter by search term
-          const matchesSearch = word.greek.toLowerCase().includes(term) ||
-            (word.greek_normalized && word.greek_normalized.toLowerCase().includes(term)) ||
-            word.english.toLowerCase().includes(term)
-
-          return matchesSearch
-        }
-      )
+    const seen = new Set()
+    return [...greekMatches, ...englishMatches, ...customMatches]
+      .filter((word) => {
+        const key = `${word.greek}|${word.english}`
+        if (seen.has(key)) return false
+        seen.add(key)
+        return true
+      })
       .slice(0, 10)
-  }, [searchTerm, customWords])
+  }, [searchTerm, customWords, englishMatches])
 
   useEffect(() => {
     // Don't update suggestions if a word is selected
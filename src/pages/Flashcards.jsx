@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react'
 import { useLocation } from 'react-router-dom'
 import dictionaryData from '../dictionary.json'
+import distractorTable from '../distractors.json'
 import { incrementTodayExercises } from '../utils/storage'
 import { getUserLists, markWordAsLearned } from '../utils/wordLists'
 import { categorizeAndSortLists } from '../utils/listCategorization'
@@ -14,6 +15,15 @@ import Badge from '../components/common/Badge'
 import useAuthGuard from '../hooks/useAuthGuard'
 import useWordLists from '../hooks/useWordLists'
 
+// Greek headword -> entry id, to look up precomputed distractors (built by build_dictionary_index.py).
+// The first entry wins for duplicate headwords, like the server's byGreek lookup.
+const entryIdByGreek = new Map()
+dictionaryData.forEach((word, index) => {
+  if (!entryIdByGreek.has(word.greek)) {
+    entryIdByGreek.set(word.greek, index)
+  }
+})
+
 const MODES = {
   GREEK_TO_ENGLISH: 'greek-to-english',
   ENGLISH_TO_GREEK: 'english-to-greek',
@@ -181,6 +191,21 @@ const Flashcards = () => {
   }
 
   const getRandomWords = (count, excludeWord) => {
+    // Dictionary words have precomputed distractors: same level and word class, similar gloss length
+    const entryId = entryIdByGreek.get(excludeWord.greek)
+    if (entryId !== undefined) {
+      const ranked = (distractorTable[entryId] || [])
+        .map((id) => dictionaryData[id].english)
+        .filter((english, index, all) => english !== excludeWord.english && all.indexOf(english) === index)
+      if (ranked.length >= count) {
+        // Pick randomly among the best candidates so repeated questions vary
+        return ranked
+          .slice(0, count + 2)
+          .sort(() => 0.5 - Math.random())
+          .slice(0, count)
+      }
+    }
+
     const availableWords = getAvailableWords()
     let shuffled = [...availableWords]
       .sort(() => 0.5 - Math.random())
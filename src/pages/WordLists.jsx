@@ -1,7 +1,8 @@
-import { useState } from 'react'
+import { useState, useRef } from 'react'
 import { createList, deleteList, removeWordFromList, unmarkWordAsLearned, getUserLists, updateListName, addWordToList } from '../utils/wordLists'
 import { categorizeAndSortLists } from '../utils/listCategorization'
 import dictionaryData from '../dictionary.json'
+import { searchDictionaryByEnglish, scanDictionaryByEnglish } from '../utils/dictionarySearch'
 import AuthModal from '../components/AuthModal'
 import Card from '../components/common/Card'
 import Button from '../components/common/Button'
@@ -23,6 +24,7 @@ const WordLists = () => {
   const [showAddWordsMode, setShowAddWordsMode] = useState(false)
   const [searchQuery, setSearchQuery] = useState('')
   const [searchResults, setSearchResults] = useState([])
+  const latestSearch = useRef('')
   const [hoveredCardId, setHoveredCardId] = useState(null)
 
   const handleCreateList = async (e) => {
@@ -149,22 +151,26 @@ const WordLists = () => {
     }
   }
 
-  const handleSearchWords = (query) => {
+  const handleSearchWords = async (query) => {
     setSearchQuery(query)
+    latestSearch.current = query
     if (!query.trim()) {
       setSearchResults([])
       return
     }
 
     const lowerQuery = query.toLowerCase()
-    const results = dictionaryData
-      .filter(word =>
-        word.greek.toLowerCase().includes(lowerQuery) ||
-        word.english.toLowerCase().includes(lowerQuery)
-      )
-      .slice(0, 20) // Limit to 20 results
-
-    setSearchResults(results)
+    const greekResults = dictionaryData.filter(word => word.greek.toLowerCase().includes(lowerQuery))
+    setSearchResults(greekResults.slice(0, 20)) // Limit to 20 results
+
+    // English matches come from the server's reverse index; scan locally if it is unreachable
+    const englishResults = await searchDictionaryByEnglish(query, 20) ??
+      scanDictionaryByEnglish(dictionaryData, query, 20)
+    if (latestSearch.current !== query) return
+
+    const seen = new Set(greekResults.map(word => word.greek))
+    const results = [...greekResults, ...englishResults.filter(word => !seen.has(word.greek))]
+    setSearchResults(results.slice(0, 20))
   }
 
   const handleAddWordToList = async (word) => {
@@ -0,0 +1,29 @@
+const API_BASE = ''
+
+/**
+ * English -> Greek search served from the dictionary's reverse index
+ * (stemmed gloss words, best matches first). Returns null when the server
+ * cannot answer, so callers can fall back to scanning the bundled dictionary.
+ */
+export const searchDictionaryByEnglish = async (query, limit = 10, signal) => {
+  try {
+    const params = new URLSearchParams({ q: query, k: String(limit) })
+    const response = await fetch(`${API_BASE}/api/dictionary/search?${params}`, { signal })
+    if (!response.ok) throw new Error('Failed to search dictionary')
+
+    const data = await response.json()
+    return data.words || []
+  } catch (error) {
+    if (error.name === 'AbortError') throw error
+    console.error('Error searching dictionary:', error)
+    return null
+  }
+}
+
+/**
+ * Offline fallback: substring match on the English gloss
+ */
+export const scanDictionaryByEnglish = (words, query, limit = 10) => {
+  const term = query.toLowerCase().trim()
+  return words.filter(word => word.english.toLowerCase().includes(term)).slice(0, limit)
+}